@@ -1,14 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from typing import List
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
 import joblib
 import os
+import threading
 from datetime import datetime, timedelta
-import random
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -56,10 +57,20 @@ class AQIInput(BaseModel):
 class DateInput(BaseModel):
     date: str  # Format: YYYY-MM-DD
 
+class BatchInput(BaseModel):
+    items: List[AQIInput]
+
 
 # Load or train model
 def train_model():
-    df = pd.read_csv(DATA_PATH)
+    # Only read the numeric columns so the CSV tokenizer skips the
+    # site/source text fields
+    wanted_columns = {'date', 'overall_aqi_value', 'aqi', 'co', 'ozone',
+                      'pm10', 'pm25', 'no2'}
+    df = pd.read_csv(
+        DATA_PATH,
+        usecols=lambda c: c.strip().lower().replace(" ", "_") in wanted_columns
+    )
 
     # Clean dataset (rename columns if needed)
     df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
@@ -99,12 +110,34 @@ else:
     else:
         raise FileNotFoundError("No model found. Please train a model first.")
 
+# Let ensemble models evaluate their trees in parallel at prediction
+# time; tree traversal releases the GIL so the threads scale across cores
+if hasattr(model, 'n_jobs'):
+    model.n_jobs = -1
+
+# Reusable single-row feature buffer for /predict so each request fills
+# a preallocated array in place instead of allocating a fresh ndarray.
+# Thread-local because FastAPI runs sync endpoints on a thread pool.
+_prediction_buffers = threading.local()
+
+
+def _single_row_buffer() -> np.ndarray:
+    """Get this thread's preallocated (1, n_features) buffer"""
+    buffer = getattr(_prediction_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = np.empty((1, len(feature_names)), dtype=np.float64)
+        _prediction_buffers.buffer = buffer
+    return buffer
+
 # Load time-series forecasting model
 sarimax_forecaster = None
 sarimax_metadata = None
 training_data = None
 
-if TIME_SERIES_AVAILABLE and os.path.exists(SARIMAX_MODEL_PATH):
+# save_model writes a .sm results file plus an .npz data sidecar next to
+# the base path, so availability is gated on those artifacts
+if TIME_SERIES_AVAILABLE and os.path.exists(f"{SARIMAX_MODEL_PATH}.sm") \
+        and os.path.exists(f"{SARIMAX_MODEL_PATH}.npz"):
     try:
         sarimax_forecaster, sarimax_metadata = load_trained_model()
         
@@ -164,10 +197,11 @@ def get_model_status():
 def predict_aqi(input_data: AQIInput):
     # Create feature vector based on enhanced model
     if feature_names is not None:
-        # Use enhanced model with proper feature engineering
-        features = create_prediction_features(input_data)
-        data = np.array([features])
-        
+        # Use enhanced model with proper feature engineering, filling the
+        # thread-local buffer in place instead of allocating per request
+        data = _single_row_buffer()
+        data[0, :] = create_prediction_features(input_data)
+
         # Apply scaling if scaler is available
         if scaler is not None:
             data = scaler.transform(data)
@@ -209,12 +243,61 @@ def predict_aqi(input_data: AQIInput):
     }
 
 
+@app.post("/predict-batch")
+def predict_aqi_batch(input_data: BatchInput):
+    """Predict AQI for a batch of inputs with a single model call.
+
+    Feeding all rows through one scaler.transform and one model.predict
+    amortizes the fixed per-call overhead of the RandomForest instead of
+    paying it once per input.
+    """
+    items = input_data.items
+    if not items:
+        return {"predictions": []}
+
+    if feature_names is not None:
+        # The shared temporal features are computed once for the batch
+        temporal = _today_temporal_features()
+        data = np.asarray([create_prediction_features(item, temporal)
+                           for item in items])
+        if scaler is not None:
+            data = scaler.transform(data)
+    else:
+        # Fallback to original format
+        data = np.asarray([
+            [
+                item.Temperature,
+                item.Humidity,
+                item.WindSpeed,
+                item.NO2,
+                item.CO,
+                item.PM25,
+                item.PM10
+            ]
+            for item in items
+        ])
+
+    predictions = model.predict(data)
+
+    results = []
+    for item, prediction in zip(items, predictions):
+        category = categorize_aqi(prediction)
+        results.append({
+            "predicted_AQI": round(float(prediction), 2),
+            "category": category,
+            "explanation": generate_explanation(item, prediction, category)
+        })
+
+    return {"predictions": results}
+
+
 @app.post("/predict-by-date")
 def predict_aqi_by_date(input_data: DateInput):
     """Predict AQI for a specific date using time-series forecasting or historical data"""
     try:
-        # Parse the input date
-        target_date = datetime.strptime(input_data.date, "%Y-%m-%d")
+        # Parse the input date (fromisoformat is the C fast path for
+        # YYYY-MM-DD, avoiding strptime's format machinery per request)
+        target_date = datetime.fromisoformat(input_data.date)
         
         # Check if SARIMAX model is available for time-series forecasting
         if sarimax_forecaster is not None and training_data is not None:
@@ -353,13 +436,72 @@ def predict_aqi_by_date(input_data: DateInput):
         return {"error": f"Prediction failed: {str(e)}"}
 
 
-def create_prediction_features(input_data: AQIInput) -> list:
-    """Create feature vector for enhanced model prediction"""
-    from datetime import datetime
-    
-    # Get current date for temporal features
-    now = datetime.now()
-    
+# Pollutant explanation lookup tables, fixed order PM2.5/PM10/NO2/CO so
+# selecting the dominant pollutant is an argmax + table index instead of
+# dict construction and an if/elif chain per request. Each entry is
+# (high_threshold, high_message, elevated_threshold, elevated_message).
+_POLLUTANT_MESSAGES = (
+    (50, "High PM2.5 levels ({v} µg/m³) are the primary concern - these fine particles can penetrate deep into lungs.",
+     25, "Elevated PM2.5 levels ({v} µg/m³) contribute significantly to air quality concerns."),
+    (100, "High PM10 levels ({v} µg/m³) indicate significant coarse particle pollution.",
+     50, "Elevated PM10 levels ({v} µg/m³) contribute to air quality degradation."),
+    (100, "High NO2 levels ({v} µg/m³) suggest heavy traffic or industrial emissions.",
+     50, "Elevated NO2 levels ({v} µg/m³) indicate moderate traffic-related pollution."),
+    (10, "High CO levels ({v} mg/m³) indicate incomplete combustion from vehicles or industry.",
+     5, "Elevated CO levels ({v} mg/m³) suggest moderate combustion-related pollution."),
+)
+
+# Single-tier variant used for date-based predictions (no CO message)
+_DATE_POLLUTANT_MESSAGES = (
+    (50, "High PM2.5 levels ({v} µg/m³) are the primary concern."),
+    (100, "High PM10 levels ({v} µg/m³) indicate significant particle pollution."),
+    (60, "Elevated NO2 levels ({v} µg/m³) suggest traffic-related pollution."),
+    (float('inf'), None),
+)
+
+
+def categorize_aqi(aqi: float) -> str:
+    """Map an AQI value to its category label"""
+    if aqi <= 50:
+        return "Good"
+    elif aqi <= 100:
+        return "Moderate"
+    elif aqi <= 200:
+        return "Poor"
+    elif aqi <= 300:
+        return "Very Poor"
+    else:
+        return "Hazardous"
+
+
+# Cache for the current day's temporal features; they only change at a
+# day boundary, so there is no need to recompute them per request
+_cached_day = None
+_cached_temporal = None
+
+
+def _today_temporal_features() -> tuple:
+    """Get (month, day_of_year, is_weekend) for today, cached per day"""
+    global _cached_day, _cached_temporal
+    today = datetime.now().date()
+    if today != _cached_day:
+        _cached_temporal = (today.month, today.timetuple().tm_yday,
+                            1 if today.weekday() >= 5 else 0)
+        _cached_day = today
+    return _cached_temporal
+
+
+def create_prediction_features(input_data: AQIInput, temporal: tuple = None) -> list:
+    """Create feature vector for enhanced model prediction
+
+    Args:
+        input_data: Pollutant readings
+        temporal: Optional (month, day_of_year, is_weekend) tuple so
+                  batch callers can compute it once and share it
+    """
+    if temporal is None:
+        temporal = _today_temporal_features()
+
     # Basic pollutant features
     features = [
         input_data.CO,
@@ -368,14 +510,10 @@ def create_prediction_features(input_data: AQIInput) -> list:
         input_data.PM25,
         input_data.NO2  # Using NO2 as second pollutant
     ]
-    
-    # Temporal features
-    features.extend([
-        now.month,
-        now.timetuple().tm_yday,
-        1 if now.weekday() >= 5 else 0  # is_weekend
-    ])
-    
+
+    # Temporal features (month, day_of_year, is_weekend)
+    features.extend(temporal)
+
     return features
 
 
@@ -401,49 +539,64 @@ def create_date_prediction_features(target_date: datetime, environmental_data: d
     return features
 
 
+def _build_seasonal_ranges() -> np.ndarray:
+    """Precompute per-month sampling ranges for generate_seasonal_data.
+
+    Returns a (12, 12) array indexed by month-1 where each row holds
+    (lo, hi) pairs for humidity, wind speed, NO2, CO, PM2.5 and PM10.
+    Seasonal pattern: higher pollution in winter due to heating, lower
+    in summer due to better dispersion.
+    """
+    rows = []
+    for month in range(1, 13):
+        # Humidity ranges by season
+        if month in [6, 7, 8]:  # Summer
+            humidity = (60, 85)
+        elif month in [12, 1, 2]:  # Winter
+            humidity = (40, 70)
+        else:  # Spring/Fall
+            humidity = (50, 75)
+
+        # Wind speed (generally higher in winter/spring)
+        wind_speed = (8, 18) if month in [12, 1, 2, 3] else (5, 12)
+
+        # Pollutant ranges by season
+        if month in [12, 1, 2]:  # Winter - higher pollution
+            no2, co, pm25, pm10 = (40, 80), (2, 6), (30, 70), (40, 90)
+        elif month in [6, 7, 8]:  # Summer - moderate pollution
+            no2, co, pm25, pm10 = (25, 50), (1, 3), (20, 45), (25, 55)
+        else:  # Spring/Fall - moderate pollution
+            no2, co, pm25, pm10 = (30, 60), (1.5, 4), (25, 55), (30, 65)
+
+        rows.append(humidity + wind_speed + no2 + co + pm25 + pm10)
+
+    return np.array(rows)
+
+
+# Month-indexed lookup tables so per-request generation is a table fetch
+# plus one vectorized draw instead of a chain of branches
+_SEASONAL_RANGES = _build_seasonal_ranges()
+_SEASONS = ('Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+            'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter')
+_RNG = np.random.default_rng()
+
+
 def generate_seasonal_data(target_date: datetime) -> dict:
     """Generate realistic environmental conditions based on seasonal patterns"""
-    
+
     # Extract month and day for seasonal patterns
     month = target_date.month
     day_of_year = target_date.timetuple().tm_yday
-    
+
     # Seasonal temperature patterns (Northern Hemisphere)
     base_temp = 20 + 10 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-    temperature = base_temp + random.uniform(-5, 5)
-    
-    # Seasonal humidity patterns
-    if month in [6, 7, 8]:  # Summer
-        humidity = random.uniform(60, 85)
-    elif month in [12, 1, 2]:  # Winter
-        humidity = random.uniform(40, 70)
-    else:  # Spring/Fall
-        humidity = random.uniform(50, 75)
-    
-    # Wind speed (generally higher in winter/spring)
-    if month in [12, 1, 2, 3]:  # Winter/Spring
-        wind_speed = random.uniform(8, 18)
-    else:
-        wind_speed = random.uniform(5, 12)
-    
-    # Pollutant levels based on seasonal patterns
-    # Higher in winter due to heating, lower in summer due to better dispersion
-    if month in [12, 1, 2]:  # Winter - higher pollution
-        no2 = random.uniform(40, 80)
-        co = random.uniform(2, 6)
-        pm25 = random.uniform(30, 70)
-        pm10 = random.uniform(40, 90)
-    elif month in [6, 7, 8]:  # Summer - moderate pollution
-        no2 = random.uniform(25, 50)
-        co = random.uniform(1, 3)
-        pm25 = random.uniform(20, 45)
-        pm10 = random.uniform(25, 55)
-    else:  # Spring/Fall - moderate pollution
-        no2 = random.uniform(30, 60)
-        co = random.uniform(1.5, 4)
-        pm25 = random.uniform(25, 55)
-        pm10 = random.uniform(30, 65)
-    
+    temperature = base_temp + _RNG.uniform(-5, 5)
+
+    # Sample all remaining conditions in one vectorized draw from the
+    # precomputed per-month ranges
+    lohi = _SEASONAL_RANGES[month - 1]
+    humidity, wind_speed, no2, co, pm25, pm10 = _RNG.uniform(lohi[::2], lohi[1::2])
+
     return {
         "Temperature": round(temperature, 1),
         "Humidity": round(humidity, 1),
@@ -488,23 +641,16 @@ def generate_date_explanation(target_date: datetime, conditions: dict, predicted
     if conditions["WindSpeed"] < 5:
         explanations.append(f"Low wind speed ({conditions['WindSpeed']} m/s) prevents pollutant dispersion.")
     
-    # Primary pollutant analysis
-    pollutants = {
-        "PM2.5": conditions["PM25"],
-        "PM10": conditions["PM10"],
-        "NO2": conditions["NO2"],
-        "CO": conditions["CO"]
-    }
-    
-    max_pollutant = max(pollutants, key=pollutants.get)
-    max_value = pollutants[max_pollutant]
-    
-    if max_pollutant == "PM2.5" and max_value > 50:
-        explanations.append(f"High PM2.5 levels ({max_value} µg/m³) are the primary concern.")
-    elif max_pollutant == "PM10" and max_value > 100:
-        explanations.append(f"High PM10 levels ({max_value} µg/m³) indicate significant particle pollution.")
-    elif max_pollutant == "NO2" and max_value > 60:
-        explanations.append(f"Elevated NO2 levels ({max_value} µg/m³) suggest traffic-related pollution.")
+    # Primary pollutant analysis: argmax over the fixed-order values,
+    # then a single table lookup for the message
+    values = np.array([conditions["PM25"], conditions["PM10"],
+                       conditions["NO2"], conditions["CO"]], dtype=float)
+    idx = int(values.argmax())
+    max_value = float(values[idx])
+    threshold, message = _DATE_POLLUTANT_MESSAGES[idx]
+
+    if message is not None and max_value > threshold:
+        explanations.append(message.format(v=max_value))
     
     # Category-specific explanation
     if category == "Good":
@@ -523,14 +669,7 @@ def generate_date_explanation(target_date: datetime, conditions: dict, predicted
 
 def get_season(month: int) -> str:
     """Get season based on month"""
-    if month in [12, 1, 2]:
-        return "Winter"
-    elif month in [3, 4, 5]:
-        return "Spring"
-    elif month in [6, 7, 8]:
-        return "Summer"
-    else:
-        return "Fall"
+    return _SEASONS[month - 1]
 
 
 def generate_explanation(input_data: AQIInput, predicted_aqi: float, category: str) -> str:
@@ -556,39 +695,19 @@ def generate_explanation(input_data: AQIInput, predicted_aqi: float, category: s
     elif input_data.WindSpeed > 15:
         explanations.append(f"High wind speed ({input_data.WindSpeed} m/s) helps disperse pollutants.")
     
-    # Pollutant analysis - identify primary contributors
-    pollutants = {
-        "PM2.5": input_data.PM25,
-        "PM10": input_data.PM10,
-        "NO2": input_data.NO2,
-        "CO": input_data.CO
-    }
-    
-    # Find the highest pollutant
-    max_pollutant = max(pollutants, key=pollutants.get)
-    max_value = pollutants[max_pollutant]
-    
-    # Add pollutant-specific explanations
-    if max_pollutant == "PM2.5":
-        if max_value > 50:
-            explanations.append(f"High PM2.5 levels ({max_value} µg/m³) are the primary concern - these fine particles can penetrate deep into lungs.")
-        elif max_value > 25:
-            explanations.append(f"Elevated PM2.5 levels ({max_value} µg/m³) contribute significantly to air quality concerns.")
-    elif max_pollutant == "PM10":
-        if max_value > 100:
-            explanations.append(f"High PM10 levels ({max_value} µg/m³) indicate significant coarse particle pollution.")
-        elif max_value > 50:
-            explanations.append(f"Elevated PM10 levels ({max_value} µg/m³) contribute to air quality degradation.")
-    elif max_pollutant == "NO2":
-        if max_value > 100:
-            explanations.append(f"High NO2 levels ({max_value} µg/m³) suggest heavy traffic or industrial emissions.")
-        elif max_value > 50:
-            explanations.append(f"Elevated NO2 levels ({max_value} µg/m³) indicate moderate traffic-related pollution.")
-    elif max_pollutant == "CO":
-        if max_value > 10:
-            explanations.append(f"High CO levels ({max_value} mg/m³) indicate incomplete combustion from vehicles or industry.")
-        elif max_value > 5:
-            explanations.append(f"Elevated CO levels ({max_value} mg/m³) suggest moderate combustion-related pollution.")
+    # Pollutant analysis - identify the primary contributor with an
+    # argmax over the fixed-order values, then pick the message from the
+    # lookup table with one threshold comparison
+    values = np.array([input_data.PM25, input_data.PM10,
+                       input_data.NO2, input_data.CO], dtype=float)
+    idx = int(values.argmax())
+    max_value = float(values[idx])
+    high, high_msg, elevated, elevated_msg = _POLLUTANT_MESSAGES[idx]
+
+    if max_value > high:
+        explanations.append(high_msg.format(v=max_value))
+    elif max_value > elevated:
+        explanations.append(elevated_msg.format(v=max_value))
     
     # Add category-specific explanation
     if category == "Good":
@@ -3,7 +3,7 @@
 Test script for the Air Quality Prediction API
 """
 import requests
-import json
+import orjson
 
 # Test data
 test_data = {
@@ -21,18 +21,19 @@ def test_api():
         # Test health endpoint
         print("Testing health endpoint...")
         response = requests.get("http://127.0.0.1:8000/")
-        print(f"Health check: {response.json()}")
-        
-        # Test prediction endpoint
+        print(f"Health check: {orjson.loads(response.content)}")
+
+        # Test prediction endpoint. json= lets requests serialize the body
+        # and set the Content-Type header itself, instead of us calling
+        # json.dumps by hand; responses are decoded with orjson.
         print("\nTesting prediction endpoint...")
         response = requests.post(
             "http://127.0.0.1:8000/predict",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(test_data)
+            json=test_data
         )
-        
+
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Prediction successful!")
             print(f"Predicted AQI: {result['predicted_AQI']}")
             print(f"Category: {result['category']}")
@@ -41,7 +42,7 @@ def test_api():
         else:
             print(f"❌ Prediction failed: {response.status_code}")
             print(response.text)
-            
+
     except requests.exceptions.ConnectionError:
         print("❌ Could not connect to API. Make sure the backend is running on http://127.0.0.1:8000")
     except Exception as e:
@@ -3,17 +3,21 @@
 Test script for the Date-based Air Quality Prediction API
 """
 import requests
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 def test_date_api():
     try:
+        # One Session keeps the TCP connection alive across requests
+        session = requests.Session()
+
         # Test health endpoint
         print("Testing health endpoint...")
-        response = requests.get("http://127.0.0.1:8000/")
-        print(f"Health check: {response.json()}")
+        response = session.get("http://127.0.0.1:8000/")
+        print(f"Health check: {orjson.loads(response.content)}")
         print()
-        
+
         # Test different dates
         test_dates = [
             "2024-01-15",  # Winter
@@ -22,19 +26,24 @@ def test_date_api():
             "2024-09-15",  # Fall
             "2025-12-25",  # Future winter
         ]
-        
-        for test_date in test_dates:
-            print(f"🧪 Testing date: {test_date}")
-            print("-" * 50)
-            
-            response = requests.post(
+
+        def post_date(test_date):
+            return session.post(
                 "http://127.0.0.1:8000/predict-by-date",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"date": test_date})
+                json={"date": test_date}
             )
-            
+
+        # Fire the date requests concurrently so client-side waits overlap,
+        # then print the responses in the original order.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(post_date, test_dates))
+
+        for test_date, response in zip(test_dates, responses):
+            print(f"🧪 Testing date: {test_date}")
+            print("-" * 50)
+
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if "error" in result:
                     print(f"❌ Error: {result['error']}")
                 else:
@@ -53,9 +62,9 @@ def test_date_api():
             else:
                 print(f"❌ Prediction failed: {response.status_code}")
                 print(response.text)
-            
+
             print()
-            
+
     except requests.exceptions.ConnectionError:
         print("❌ Could not connect to API. Make sure the backend is running on http://127.0.0.1:8000")
     except Exception as e: